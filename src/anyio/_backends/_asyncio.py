@@ -15,7 +15,7 @@ from io import IOBase
 from os import PathLike
 from queue import Queue
 from socket import AddressFamily, SocketKind, SocketType
-from threading import Thread
+from threading import Lock, Thread
 from types import TracebackType
 from typing import (
     Any, Awaitable, Callable, Collection, Coroutine, Deque, Dict, Generator, Iterable, List,
@@ -709,6 +709,15 @@ class WorkerThread(Thread):
         self.queue: Queue[Union[Tuple[Callable, tuple, asyncio.Future], None]] = Queue(2)
         self.idle_since = current_time()
 
+    @staticmethod
+    def _report_result(future: asyncio.Future, result: Any,
+                       exc: Optional[BaseException]) -> None:
+        if not future.cancelled():
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
     def run(self) -> None:
         with claim_worker_thread('asyncio'):
             threadlocals.loop = self.loop
@@ -720,14 +729,16 @@ class WorkerThread(Thread):
 
                 func, args, future = item
                 if not future.cancelled():
+                    result = None
+                    exception: Optional[BaseException] = None
                     try:
                         result = func(*args)
                     except BaseException as exc:
-                        if not self.loop.is_closed() and not future.cancelled():
-                            self.loop.call_soon_threadsafe(future.set_exception, exc)
-                    else:
-                        if not self.loop.is_closed() and not future.cancelled():
-                            self.loop.call_soon_threadsafe(future.set_result, result)
+                        exception = exc
+
+                    if not self.loop.is_closed():
+                        self.loop.call_soon_threadsafe(
+                            self._report_result, future, result, exception)
 
                 self.queue.task_done()
 
@@ -819,12 +830,51 @@ class BlockingPortal(abc.BlockingPortal):
     def __init__(self):
         super().__init__()
         self._loop = get_running_loop()
+        self._spawn_queue: Deque[Tuple[Callable, tuple, Dict[str, Any], Any, Future]] = deque()
+        self._spawn_queue_lock = Lock()
+        self._drain_scheduled = False
+
+    def _drain_spawn_queue(self) -> None:
+        with self._spawn_queue_lock:
+            items = list(self._spawn_queue)
+            self._spawn_queue.clear()
+            self._drain_scheduled = False
+
+        for func, args, kwargs, name, future in items:
+            try:
+                self._task_group.start_soon(
+                    self._call_func, func, args, kwargs, future, name=name)
+            except BaseException as exc:
+                if not future.cancelled():
+                    future.set_exception(exc)
 
     def _spawn_task_from_thread(self, func: Callable, args: tuple, kwargs: Dict[str, Any],
                                 name, future: Future) -> None:
-        run_sync_from_thread(
-            partial(self._task_group.start_soon, name=name), self._call_func, func, args, kwargs,
-            future, loop=self._loop)
+        # Queue the task and wake up the event loop only if no wakeup is already pending, so a
+        # burst of dispatches from worker threads costs a single loop callback
+        with self._spawn_queue_lock:
+            self._spawn_queue.append((func, args, kwargs, name, future))
+            schedule_drain = not self._drain_scheduled
+            self._drain_scheduled = True
+
+        if schedule_drain:
+            try:
+                self._loop.call_soon_threadsafe(self._drain_spawn_queue)
+            except RuntimeError as exc:
+                # The event loop was closed; fail any queued dispatches
+                with self._spawn_queue_lock:
+                    items = list(self._spawn_queue)
+                    self._spawn_queue.clear()
+                    self._drain_scheduled = False
+
+                for item in items:
+                    if not item[4].cancelled():
+                        item[4].set_exception(exc)
+
+                raise
+
+    async def _wait_future(self, future: Future) -> None:
+        await asyncio.wrap_future(future)
 
 
 #
@@ -181,6 +181,11 @@ class BlockingPortal(abc.BlockingPortal):
             partial(self._task_group.start_soon, name=name), self._call_func, func, args, kwargs,
             future, trio_token=self._token)
 
+    async def _wait_future(self, future: Future) -> None:
+        event = trio.Event()
+        future.add_done_callback(lambda f: self._token.run_sync_soon(event.set))
+        await event.wait()
+
 
 #
 # Subprocesses
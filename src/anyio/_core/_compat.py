@@ -1,3 +1,5 @@
+import sys
+import warnings
 from abc import ABCMeta, abstractmethod
 from contextlib import AbstractContextManager
 from typing import (
@@ -72,6 +74,31 @@ def maybe_async_cm(cm: Union[ContextManager[T], AsyncContextManager[T]]) -> Asyn
     return _ContextManagerWrapper(cm)
 
 
+def warn_deprecated(message: str) -> None:
+    """
+    Emit a :exc:`DeprecationWarning`, attributed to the caller of the deprecated function.
+
+    When the first matching warnings filter ignores the warning unconditionally, the (costly)
+    warnings machinery is skipped entirely. Any other filter configuration falls through to
+    :func:`warnings.warn`. The caller's module is resolved here and used in the filter scan, so
+    both paths always agree on the attribution.
+
+    :param message: the warning message
+
+    """
+    module = sys._getframe(1).f_globals.get('__name__', '')
+    for action, msg_regex, category, mod_regex, lineno in warnings.filters:
+        if (issubclass(DeprecationWarning, category)
+                and (msg_regex is None or msg_regex.match(message))
+                and (mod_regex is None or mod_regex.match(module))):
+            if action == 'ignore' and lineno == 0:
+                return
+
+            break
+
+    warn(message, DeprecationWarning, stacklevel=2)
+
+
 def _warn_deprecation(awaitable: AnyDeprecatedAwaitable, stacklevel: int = 1) -> None:
     warn(f'Awaiting on {awaitable._name}() is deprecated. Use "await '
          f'anyio.maybe_awaitable({awaitable._name}(...)) if you have to support both AnyIO 2.x '
@@ -2,6 +2,7 @@ import math
 import sys
 import threading
 from contextlib import contextmanager
+from functools import lru_cache
 from importlib import import_module
 from typing import Any, Callable, Coroutine, Dict, Generator, Optional, Tuple, Type, TypeVar
 
@@ -131,12 +132,17 @@ def claim_worker_thread(backend) -> Generator[Any, None, None]:
         del threadlocals.current_async_module
 
 
-def get_asynclib(asynclib_name: Optional[str] = None):
-    if asynclib_name is None:
-        asynclib_name = sniffio.current_async_library()
-
+@lru_cache(maxsize=None)
+def _get_backend_module(asynclib_name: str):
     modulename = 'anyio._backends._' + asynclib_name
     try:
         return sys.modules[modulename]
     except KeyError:
         return import_module(modulename)
+
+
+def get_asynclib(asynclib_name: Optional[str] = None):
+    if asynclib_name is None:
+        asynclib_name = sniffio.current_async_library()
+
+    return _get_backend_module(asynclib_name)
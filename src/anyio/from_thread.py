@@ -1,22 +1,68 @@
+import sys
 import threading
-from functools import partial
-from asyncio import iscoroutine
-from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache, partial
+from asyncio import iscoroutine, iscoroutinefunction
+from concurrent.futures import CancelledError, Future
+from concurrent.futures._base import CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED
 from contextlib import AbstractContextManager, contextmanager
-from types import TracebackType
+from types import MethodType, TracebackType
 from typing import (
-    Any, AsyncContextManager, Callable, ContextManager, Coroutine, Dict, Generator, Iterable,
+    Any, AsyncContextManager, Callable, ContextManager, Coroutine, Dict, Generator, List,
     Optional, Tuple, Type, TypeVar, cast, overload)
-from warnings import warn
 
 from ._core import _eventloop
+from ._core._compat import warn_deprecated
 from ._core._eventloop import get_asynclib, get_cancelled_exc_class, threadlocals
 from ._core._synchronization import Event
 from ._core._tasks import CancelScope, TaskStatus, create_task_group
 
+if sys.version_info >= (3, 8):
+    from concurrent.futures import InvalidStateError
+else:
+    # Futures on earlier Pythons don't check their state in set_result(), so this never gets
+    # raised there
+    class InvalidStateError(Exception):
+        """The operation is not allowed in this state."""
+
 T_Retval = TypeVar('T_Retval')
 T_co = TypeVar('T_co')
 
+# Shared by dispatches that pass no keyword arguments (the common case), to avoid allocating a
+# fresh empty dict for each of them
+_EMPTY_KWARGS: Dict[str, Any] = {}
+
+_ident_cache = threading.local()
+
+
+def _thread_ident() -> int:
+    """Return the current thread's identifier, cached in a thread local."""
+    try:
+        return _ident_cache.ident
+    except AttributeError:
+        ident = _ident_cache.ident = threading.get_ident()
+        return ident
+
+
+@lru_cache(maxsize=1024)
+def _is_coro_func_cached(func: Callable) -> bool:
+    return iscoroutinefunction(func)
+
+
+def _is_coro_func(func: Callable) -> bool:
+    """Memoized check for whether the callable is a coroutine function."""
+    # Unwrap partials and bound methods so the cache only ever holds the underlying functions,
+    # and not the (possibly short-lived) objects they are bound to or that they capture
+    while isinstance(func, partial):
+        func = func.func
+
+    if isinstance(func, MethodType):
+        func = func.__func__
+
+    try:
+        return _is_coro_func_cached(func)
+    except TypeError:  # func is not hashable
+        return iscoroutinefunction(func)
+
 
 def run(func: Callable[..., Coroutine[Any, Any, T_Retval]], *args, **kwargs) -> T_Retval:
     """
@@ -27,18 +73,19 @@ def run(func: Callable[..., Coroutine[Any, Any, T_Retval]], *args, **kwargs) ->
     :return: the return value of the coroutine function
 
     """
-    try:
-        asynclib = threadlocals.current_async_module
-    except AttributeError:
+    asynclib = getattr(threadlocals, 'current_async_module', None)
+    if asynclib is None:
         raise RuntimeError('This function can only be run from an AnyIO worker thread')
 
-    func_kwargs = partial(func, **kwargs)
-    return asynclib.run_async_from_thread(func_kwargs, *args)
+    if kwargs:
+        func = partial(func, **kwargs)
+
+    return asynclib.run_async_from_thread(func, *args)
 
 
 def run_async_from_thread(func: Callable[..., Coroutine[Any, Any, T_Retval]], *args) -> T_Retval:
-    warn('run_async_from_thread() has been deprecated, use anyio.from_thread.run() instead',
-         DeprecationWarning)
+    warn_deprecated('run_async_from_thread() has been deprecated, use anyio.from_thread.run() '
+                    'instead')
     return run(func, *args)
 
 
@@ -51,27 +98,91 @@ def run_sync(func: Callable[..., T_Retval], *args, **kwargs) -> T_Retval:
     :return: the return value of the callable
 
     """
-    try:
-        asynclib = threadlocals.current_async_module
-    except AttributeError:
+    asynclib = getattr(threadlocals, 'current_async_module', None)
+    if asynclib is None:
         raise RuntimeError('This function can only be run from an AnyIO worker thread')
 
-    func_kwargs = partial(func, **kwargs)
-    return asynclib.run_sync_from_thread(func_kwargs, *args)
+    if kwargs:
+        func = partial(func, **kwargs)
+
+    return asynclib.run_sync_from_thread(func, *args)
 
 
 def run_sync_from_thread(func: Callable[..., T_Retval], *args) -> T_Retval:
-    warn('run_sync_from_thread() has been deprecated, use anyio.from_thread.run_sync() instead',
-         DeprecationWarning)
+    warn_deprecated('run_sync_from_thread() has been deprecated, use anyio.from_thread.run_sync() '
+                    'instead')
     return run_sync(func, *args)
 
 
+class _PortalFuture(Future):
+    """A future whose completion state can be read with a single lock acquisition."""
+
+    _cancel_info: Optional[Tuple['BlockingPortal', CancelScope]] = None
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        # Fast path: a completed future never changes state again, so the condition lock can be
+        # skipped (setters publish the result/exception before flipping the state, and the GIL
+        # orders these reads after that write)
+        state = self._state
+        if state == FINISHED:
+            exception = self._exception
+            if exception is not None:
+                raise exception
+
+            return self._result
+        if state in (CANCELLED, CANCELLED_AND_NOTIFIED):
+            raise CancelledError
+
+        return super().result(timeout)
+
+    def _get_snapshot(self) -> Tuple[bool, bool, Any, Optional[BaseException]]:
+        """Return a ``(done, cancelled, result, exception)`` tuple atomically."""
+        with self._condition:
+            if self._state == FINISHED:
+                return True, False, self._result, self._exception
+            if self._state in (CANCELLED, CANCELLED_AND_NOTIFIED):
+                return True, True, None, None
+            return False, False, None, None
+
+
+def _await_future(future: '_PortalFuture') -> Any:
+    """
+    Return the result of the future, raising its exception if it failed.
+
+    Unlike :meth:`~concurrent.futures.Future.result`, an already completed future is handled with
+    a single state snapshot instead of separate locked reads for the state, result and exception.
+
+    """
+    done, cancelled, result, exception = future._get_snapshot()
+    if done:
+        if cancelled:
+            raise CancelledError
+        if exception is not None:
+            raise exception
+
+        return result
+
+    return future.result()
+
+
+def _cancel_scope_on_future_cancel(future: Future) -> None:
+    """Done callback that relays cancellation of the future into the task's cancel scope."""
+    portal_future = cast(_PortalFuture, future)
+    cancel_info = portal_future._cancel_info
+    if cancel_info is not None:
+        _, cancelled, _, _ = portal_future._get_snapshot()
+        if cancelled:
+            portal, scope = cancel_info
+            portal.call(scope.cancel)
+
+
 class _BlockingAsyncContextManager(AbstractContextManager):
-    _enter_future: Future
-    _exit_future: Future
-    _exit_event: Event
-    _exit_exc_info: Tuple[Optional[Type[BaseException]], Optional[BaseException],
-                          Optional[TracebackType]]
+    _enter_future: '_PortalFuture'
+    _exit_future: '_PortalFuture'
+    _exit_signal: Future
+    _exit_exc_type: Optional[Type[BaseException]] = None
+    _exit_exc_value: Optional[BaseException] = None
+    _exit_tb: Optional[TracebackType] = None
 
     def __init__(self, async_cm: AsyncContextManager[T_co], portal: 'BlockingPortal'):
         self._async_cm = async_cm
@@ -79,7 +190,7 @@ class _BlockingAsyncContextManager(AbstractContextManager):
 
     async def run_async_cm(self):
         try:
-            self._exit_event = Event()
+            self._exit_signal = Future()
             value = await self._async_cm.__aenter__()
         except BaseException as exc:
             self._enter_future.set_exception(exc)
@@ -87,21 +198,32 @@ class _BlockingAsyncContextManager(AbstractContextManager):
         else:
             self._enter_future.set_result(value)
 
-        await self._exit_event.wait()
-        return await self._async_cm.__aexit__(*self._exit_exc_info)
+        await self._portal._wait_future(self._exit_signal)
+        return await self._async_cm.__aexit__(self._exit_exc_type, self._exit_exc_value,
+                                              self._exit_tb)
 
     def __enter__(self) -> T_co:
-        self._enter_future = Future()
-        self._exit_future = self._portal.start_task_soon(self.run_async_cm)
-        cm = self._enter_future.result()
+        self._enter_future = _PortalFuture()
+        self._exit_future = cast(_PortalFuture, self._portal.start_task_soon(self.run_async_cm))
+        cm = _await_future(self._enter_future)
         return cast(T_co, cm)
 
     def __exit__(self, __exc_type: Optional[Type[BaseException]],
                  __exc_value: Optional[BaseException],
                  __traceback: Optional[TracebackType]) -> Optional[bool]:
-        self._exit_exc_info = __exc_type, __exc_value, __traceback
-        self._portal.call(self._exit_event.set)
-        return self._exit_future.result()
+        if __exc_type is not None:
+            self._exit_exc_type = __exc_type
+            self._exit_exc_value = __exc_value
+            self._exit_tb = __traceback
+
+        if not self._exit_signal.cancelled():
+            try:
+                self._exit_signal.set_result(None)
+            except InvalidStateError:
+                # The portal task was cancelled between the check and the call
+                pass
+
+        return _await_future(self._exit_future)
 
 
 class _BlockingPortalTaskStatus(TaskStatus):
@@ -111,6 +233,19 @@ class _BlockingPortalTaskStatus(TaskStatus):
     def started(self, value=None) -> None:
         self._future.set_result(value)
 
+    def _task_done(self, future: Future) -> None:
+        """Resolve the status future if the task finished without calling ``started()``."""
+        status_future = self._future
+        if not status_future.done():
+            _, cancelled, _, exception = cast(_PortalFuture, future)._get_snapshot()
+            if cancelled:
+                status_future.cancel()
+            elif exception is not None:
+                status_future.set_exception(exception)
+            else:
+                exc = RuntimeError('Task exited without calling task_status.started()')
+                status_future.set_exception(exc)
+
 
 class BlockingPortal:
     """An object that lets external threads run code in an asynchronous event loop."""
@@ -133,9 +268,10 @@ class BlockingPortal:
         return await self._task_group.__aexit__(exc_type, exc_val, exc_tb)
 
     def _check_running(self) -> None:
-        if self._event_loop_thread_id is None:
+        event_loop_thread_id = self._event_loop_thread_id
+        if event_loop_thread_id is None:
             raise RuntimeError('This portal is not running')
-        if self._event_loop_thread_id == threading.get_ident():
+        if event_loop_thread_id == _thread_ident():
             raise RuntimeError('This method cannot be called from the event loop thread')
 
     async def sleep_until_stopped(self) -> None:
@@ -159,35 +295,55 @@ class BlockingPortal:
             self._task_group.cancel_scope.cancel()
 
     async def _call_func(self, func: Callable, args: tuple, kwargs: Dict[str, Any],
-                         future: Future) -> None:
-        def callback(f: Future):
-            if f.cancelled():
-                self.call(scope.cancel)
+                         future: '_PortalFuture') -> None:
+        try:
+            retval = func(*args, **kwargs) if kwargs else func(*args)
+        except self._cancelled_exc_class:
+            future.cancel()
+        except BaseException as exc:
+            _, cancelled, _, _ = future._get_snapshot()
+            if not cancelled:
+                future.set_exception(exc)
 
+            # Let base exceptions fall through
+            if not isinstance(exc, Exception):
+                raise
+        else:
+            if _is_coro_func(func) or iscoroutine(retval):
+                await self._call_async_func(retval, future)
+            else:
+                _, cancelled, _, _ = future._get_snapshot()
+                if not cancelled:
+                    future.set_result(retval)
+
+    async def _call_async_func(self, coro: Coroutine, future: '_PortalFuture') -> None:
         try:
-            retval = func(*args, **kwargs)
-            if iscoroutine(retval):
-                with CancelScope() as scope:
-                    if future.cancelled():
-                        scope.cancel()
-                    else:
-                        future.add_done_callback(callback)
-
-                    retval = await retval
+            with CancelScope() as scope:
+                _, cancelled, _, _ = future._get_snapshot()
+                if cancelled:
+                    scope.cancel()
+                else:
+                    future._cancel_info = self, scope
+                    future.add_done_callback(_cancel_scope_on_future_cancel)
+
+                retval = await coro
         except self._cancelled_exc_class:
             future.cancel()
         except BaseException as exc:
-            if not future.cancelled():
+            _, cancelled, _, _ = future._get_snapshot()
+            if not cancelled:
                 future.set_exception(exc)
 
             # Let base exceptions fall through
             if not isinstance(exc, Exception):
                 raise
         else:
-            if not future.cancelled():
+            _, cancelled, _, _ = future._get_snapshot()
+            if not cancelled:
                 future.set_result(retval)
         finally:
-            scope = None
+            # Break the reference cycle between the future and the cancel scope
+            future._cancel_info = None
 
     def _spawn_task_from_thread(self, func: Callable, args: tuple, kwargs: Dict[str, Any],
                                 name, future: Future) -> None:
@@ -206,6 +362,15 @@ class BlockingPortal:
         """
         raise NotImplementedError
 
+    async def _wait_future(self, future: Future) -> None:
+        """
+        Wait until the given future has been resolved from another thread.
+
+        :param future: the future to wait on
+
+        """
+        raise NotImplementedError
+
     @overload
     def call(self, func: Callable[..., Coroutine[Any, Any, T_Retval]], *args) -> T_Retval:
         ...
@@ -225,7 +390,7 @@ class BlockingPortal:
             the event loop thread
 
         """
-        return self.start_task_soon(func, *args).result()
+        return _await_future(cast(_PortalFuture, self.start_task_soon(func, *args)))
 
     def spawn_task(self, func: Callable[..., Coroutine], *args, name=None) -> Future:
         """
@@ -245,7 +410,7 @@ class BlockingPortal:
            can keep using this until AnyIO 4.
 
         """
-        warn('spawn_task() is deprecated -- use start_task_soon() instead', DeprecationWarning)
+        warn_deprecated('spawn_task() is deprecated -- use start_task_soon() instead')
         return self.start_task_soon(func, *args, name=name)
 
     def start_task_soon(self, func: Callable[..., Coroutine], *args, name=None) -> Future:
@@ -267,8 +432,8 @@ class BlockingPortal:
 
         """
         self._check_running()
-        f: Future = Future()
-        self._spawn_task_from_thread(func, args, {}, name, f)
+        f: _PortalFuture = _PortalFuture()
+        self._spawn_task_from_thread(func, args, _EMPTY_KWARGS, name, f)
         return f
 
     def start_task(self, func: Callable[..., Coroutine], *args, name=None) -> Tuple[Future, Any]:
@@ -286,23 +451,13 @@ class BlockingPortal:
         .. versionadded:: 3.0
 
         """
-        def task_done(future: Future) -> None:
-            if not task_status_future.done():
-                if future.cancelled():
-                    task_status_future.cancel()
-                elif future.exception():
-                    task_status_future.set_exception(future.exception())
-                else:
-                    exc = RuntimeError('Task exited without calling task_status.started()')
-                    task_status_future.set_exception(exc)
-
         self._check_running()
-        task_status_future: Future = Future()
+        task_status_future: _PortalFuture = _PortalFuture()
         task_status = _BlockingPortalTaskStatus(task_status_future)
-        f: Future = Future()
-        f.add_done_callback(task_done)
+        f: _PortalFuture = _PortalFuture()
+        f.add_done_callback(task_status._task_done)
         self._spawn_task_from_thread(func, args, {'task_status': task_status}, name, f)
-        return f, task_status_future.result()
+        return f, _await_future(task_status_future)
 
     def wrap_async_context_manager(self, cm: AsyncContextManager[T_co]) -> ContextManager[T_co]:
         """
@@ -311,12 +466,24 @@ class BlockingPortal:
         Spawns a task that will call both ``__aenter__()`` and ``__aexit__()``, stopping in the
         middle until the synchronous context manager exits.
 
+        If the given object also implements the synchronous context manager protocol, it is
+        returned as is and entered/exited directly in the calling thread, skipping the portal
+        round-trips and the task spawn entirely. The synchronous protocol support must be genuine:
+        an async-only object whose ``__enter__`` merely raises to redirect users towards
+        ``async with`` will fail when entered this way.
+
         :param cm: an asynchronous context manager
         :return: a synchronous context manager
 
         .. versionadded:: 2.1
+        .. versionchanged:: 3.1
+            Context managers that also implement the synchronous context manager protocol are now
+            returned as is, without involving the portal.
 
         """
+        if isinstance(cm, AbstractContextManager):
+            return cast(ContextManager[T_co], cm)
+
         return _BlockingAsyncContextManager(cm, self)
 
 
@@ -331,8 +498,8 @@ def create_blocking_portal() -> BlockingPortal:
         Use :class:`.BlockingPortal` directly.
 
     """
-    warn('create_blocking_portal() has been deprecated -- use anyio.from_thread.BlockingPortal() '
-         'directly', DeprecationWarning)
+    warn_deprecated('create_blocking_portal() has been deprecated -- use '
+                    'anyio.from_thread.BlockingPortal() directly')
     return BlockingPortal()
 
 
@@ -357,20 +524,31 @@ def start_blocking_portal(
         async with BlockingPortal() as portal_:
             if future.set_running_or_notify_cancel():
                 future.set_result(portal_)
+                started_event.set()
                 await portal_.sleep_until_stopped()
 
-    future: Future[BlockingPortal] = Future()
-    with ThreadPoolExecutor(1) as executor:
-        run_future = executor.submit(_eventloop.run, run_portal, backend=backend,
-                                     backend_options=backend_options)
+    def run_blocking_portal() -> None:
         try:
-            wait(cast(Iterable[Future], [run_future, future]), return_when=FIRST_COMPLETED)
-        except BaseException:
-            future.cancel()
-            run_future.cancel()
-            raise
+            _eventloop.run(run_portal, backend=backend, backend_options=backend_options)
+        except BaseException as exc:
+            exceptions.append(exc)
+        finally:
+            started_event.set()
+
+    future: _PortalFuture = _PortalFuture()
+    started_event = threading.Event()
+    exceptions: List[BaseException] = []
+    thread = threading.Thread(target=run_blocking_portal, name='AnyIO portal thread')
+    thread.start()
+    try:
+        started_event.wait()
+    except BaseException:
+        future.cancel()
+        thread.join()
+        raise
 
-        if future.done():
+    try:
+        if future.done() and not future.cancelled():
             portal = future.result()
             try:
                 yield portal
@@ -379,5 +557,8 @@ def start_blocking_portal(
                 raise
 
             portal.call(portal.stop, False)
+    finally:
+        thread.join()
 
-        run_future.result()
+    if exceptions:
+        raise exceptions[0]
@@ -1,7 +1,7 @@
 from typing import Callable, Optional, TypeVar
 from functools import partial
-from warnings import warn
 
+from ._core._compat import warn_deprecated
 from ._core._eventloop import get_asynclib
 from .abc import CapacityLimiter
 
@@ -26,16 +26,18 @@ async def run_sync(
     :return: an awaitable that yields the return value of the function.
 
     """
-    func_kwargs = partial(func, **kwargs)
-    return await get_asynclib().run_sync_in_worker_thread(func_kwargs, *args, cancellable=cancellable,
+    if kwargs:
+        func = partial(func, **kwargs)
+
+    return await get_asynclib().run_sync_in_worker_thread(func, *args, cancellable=cancellable,
                                                           limiter=limiter)
 
 
 async def run_sync_in_worker_thread(
         func: Callable[..., T_Retval], *args, cancellable: bool = False,
         limiter: Optional[CapacityLimiter] = None) -> T_Retval:
-    warn('run_sync_in_worker_thread() has been deprecated, use anyio.to_thread.run_sync() instead',
-         DeprecationWarning)
+    warn_deprecated('run_sync_in_worker_thread() has been deprecated, use '
+                    'anyio.to_thread.run_sync() instead')
     return await run_sync(func, *args, cancellable=cancellable, limiter=limiter)
 
 
@@ -50,7 +52,6 @@ def current_default_thread_limiter() -> CapacityLimiter:
 
 
 def current_default_worker_thread_limiter() -> CapacityLimiter:
-    warn('current_default_worker_thread_limiter() has been deprecated, '
-         'use anyio.to_thread.current_default_thread_limiter() instead',
-         DeprecationWarning)
+    warn_deprecated('current_default_worker_thread_limiter() has been deprecated, '
+                    'use anyio.to_thread.current_default_thread_limiter() instead')
     return current_default_thread_limiter()
@@ -2,6 +2,7 @@ import pickle
 import signal
 import sys
 import threading
+import warnings
 
 import pytest
 
@@ -13,7 +14,7 @@ from anyio import (
     open_signal_receiver, run_async_from_thread, run_sync_from_thread, run_sync_in_worker_thread,
     to_thread)
 from anyio._core._compat import (
-    DeprecatedAwaitable, DeprecatedAwaitableFloat, DeprecatedAwaitableList)
+    DeprecatedAwaitable, DeprecatedAwaitableFloat, DeprecatedAwaitableList, warn_deprecated)
 
 pytestmark = pytest.mark.anyio
 
@@ -172,6 +173,36 @@ class TestDeprecations:
                 pass
 
 
+class TestWarnDeprecated:
+    def test_warning_emitted(self):
+        with pytest.warns(DeprecationWarning, match='this is deprecated'):
+            warn_deprecated('this is deprecated')
+
+    def test_warning_attributed_to_caller_module(self):
+        with pytest.warns(DeprecationWarning) as recorded:
+            warn_deprecated('this is deprecated')
+
+        assert recorded[0].filename == __file__
+
+    def test_blanket_ignore_skipped(self):
+        with warnings.catch_warnings(record=True) as recorded:
+            warnings.simplefilter('ignore', DeprecationWarning)
+            warn_deprecated('this is deprecated')
+
+        assert not recorded
+
+    def test_caller_module_filter_overrides_ignore(self):
+        # A filter matching the caller's module takes precedence over a later blanket ignore, on
+        # the fast path just as in the full warnings machinery
+        with warnings.catch_warnings(record=True) as recorded:
+            warnings.simplefilter('ignore', DeprecationWarning)
+            warnings.filterwarnings('always', category=DeprecationWarning, module=__name__)
+            warn_deprecated('this is deprecated')
+
+        assert len(recorded) == 1
+        assert recorded[0].category is DeprecationWarning
+
+
 class TestPickle:
     def test_deprecated_awaitable_none(self):
         obj = DeprecatedAwaitable(threading.get_ident)
@@ -297,6 +297,31 @@ class TestBlockingPortal:
                 assert cm == 'test'
                 raise Exception('should be ignored')
 
+    def test_wrap_dual_protocol_context_manager(self, anyio_backend_name, anyio_backend_options):
+        class DualCM:
+            entered_thread_id = None
+
+            def __enter__(self):
+                self.entered_thread_id = threading.get_ident()
+                return self
+
+            def __exit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+        cm = DualCM()
+        with start_blocking_portal(anyio_backend_name, anyio_backend_options) as portal:
+            wrapped = portal.wrap_async_context_manager(cm)
+            assert wrapped is cm
+            with wrapped as value:
+                assert value is cm
+                assert cm.entered_thread_id == threading.get_ident()
+
     def test_start_no_value(self, anyio_backend_name, anyio_backend_options):
         def taskfunc(*, task_status):
             task_status.started()